@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import anyio
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 
 from app.app_configs import get_settings
 from app.models.schemas import (
@@ -20,10 +24,57 @@ from app.services.file_storage import FileStorageService
 
 router = APIRouter()
 
+# How long a request waits for an execution slot before failing fast with 503.
+_EXEC_ACQUIRE_TIMEOUT_SEC = 0.05
+
+# Limits the number of concurrently executing containers
+_exec_limiter: anyio.Semaphore | None = None
+
+# Dedicated thread pool for blocking execution calls. Executions hold a thread
+# for their full duration (up to the execution timeout), so they get their own
+# bounded pool rather than competing with other offloaded work (file uploads,
+# health checks) for the shared anyio worker threads.
+_exec_thread_pool: ThreadPoolExecutor | None = None
+
 # Initialize file storage service
 _file_storage: FileStorageService | None = None
 
 
+def get_exec_thread_pool() -> ThreadPoolExecutor:
+    """Get or create the thread pool used for blocking execution calls."""
+    global _exec_thread_pool
+    if _exec_thread_pool is None:
+        settings = get_settings()
+        _exec_thread_pool = ThreadPoolExecutor(
+            max_workers=settings.max_concurrent_exec,
+            thread_name_prefix="exec",
+        )
+    return _exec_thread_pool
+
+
+def _utf8_size_exceeds(text: str, limit: int) -> bool:
+    """Check whether a string's UTF-8 encoding exceeds `limit` bytes.
+
+    The character count bounds the byte count (between 1x and 4x), so most
+    payloads are decided without paying for an encode; only borderline sizes
+    are actually encoded.
+    """
+    if len(text) > limit:
+        return True
+    if len(text) * 4 <= limit:
+        return False
+    return len(text.encode("utf-8")) > limit
+
+
+def get_exec_limiter() -> anyio.Semaphore:
+    """Get or create the global execution concurrency limiter."""
+    global _exec_limiter
+    if _exec_limiter is None:
+        settings = get_settings()
+        _exec_limiter = anyio.Semaphore(settings.max_concurrent_exec)
+    return _exec_limiter
+
+
 def get_file_storage() -> FileStorageService:
     """Get or create the global FileStorageService instance."""
     global _file_storage
@@ -33,9 +84,19 @@ def get_file_storage() -> FileStorageService:
     return _file_storage
 
 
-@router.post("/execute", response_model=ExecuteResponse, status_code=status.HTTP_200_OK)
-def execute(req: ExecuteRequest) -> ExecuteResponse:
-    """Execute provided Python code synchronously within an isolated Docker container."""
+@router.post(
+    "/execute",
+    response_model=ExecuteResponse,
+    status_code=status.HTTP_200_OK,
+    response_class=ORJSONResponse,
+)
+async def execute(req: ExecuteRequest) -> ExecuteResponse:
+    """Execute provided Python code synchronously within an isolated Docker container.
+
+    Concurrency is capped by a semaphore: each execution holds a heavyweight
+    container for its full duration, so excess requests get a fast 503
+    instead of piling onto the host.
+    """
     settings = get_settings()
 
     if req.timeout_ms > settings.max_exec_timeout_ms:
@@ -44,6 +105,18 @@ def execute(req: ExecuteRequest) -> ExecuteResponse:
             detail=f"timeout_ms exceeds maximum of {settings.max_exec_timeout_ms} ms",
         )
 
+    # Reject oversize payloads before any staging or container work
+    if _utf8_size_exceeds(req.code, settings.max_code_bytes):
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"code exceeds maximum of {settings.max_code_bytes} bytes",
+        )
+    if req.stdin is not None and _utf8_size_exceeds(req.stdin, settings.max_stdin_bytes):
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"stdin exceeds maximum of {settings.max_stdin_bytes} bytes",
+        )
+
     staged_files: list[tuple[str, bytes]] = []
     storage = get_file_storage()
 
@@ -51,6 +124,14 @@ def execute(req: ExecuteRequest) -> ExecuteResponse:
     input_files_map: dict[str, bytes] = {}
 
     for file in req.files:
+        # Reject duplicate workspace paths up front instead of silently
+        # staging (and fetching) the same path twice with last-one-wins.
+        if file.path in input_files_map:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Duplicate file path '{file.path}' in request.",
+            )
+
         # Fetch content from storage by file_id
         try:
             content, _ = storage.get_file(file.file_id)
@@ -63,22 +144,40 @@ def execute(req: ExecuteRequest) -> ExecuteResponse:
         staged_files.append((file.path, content))
         input_files_map[file.path] = content
 
+    limiter = get_exec_limiter()
+    try:
+        with anyio.fail_after(_EXEC_ACQUIRE_TIMEOUT_SEC):
+            await limiter.acquire()
+    except TimeoutError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy: too many concurrent executions.",
+        ) from exc
+
     try:
-        result: ExecutionResult = execute_python(
-            code=req.code,
-            stdin=req.stdin,
-            timeout_ms=req.timeout_ms,
-            max_output_bytes=settings.max_output_bytes,
-            cpu_time_limit_sec=settings.cpu_time_limit_sec,
-            memory_limit_mb=settings.memory_limit_mb,
-            files=staged_files,
-            last_line_interactive=req.last_line_interactive,
+        loop = asyncio.get_running_loop()
+        result: ExecutionResult = await loop.run_in_executor(
+            get_exec_thread_pool(),
+            partial(
+                execute_python,
+                code=req.code,
+                stdin=req.stdin,
+                timeout_ms=req.timeout_ms,
+                max_output_bytes=settings.max_output_bytes,
+                cpu_time_limit_sec=settings.cpu_time_limit_sec,
+                memory_limit_mb=settings.memory_limit_mb,
+                files=staged_files,
+                last_line_interactive=req.last_line_interactive,
+                no_cache=req.no_cache,
+            ),
         )
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(exc),
         ) from exc
+    finally:
+        limiter.release()
 
     # Save output files to storage and return file IDs
     # Only include files that were created or modified (not unchanged input files or directories)
@@ -14,6 +14,14 @@ PYTHON_EXECUTOR_DOCKER_IMAGE = (
 )
 PYTHON_EXECUTOR_DOCKER_RUN_ARGS = os.environ.get("PYTHON_EXECUTOR_DOCKER_RUN_ARGS") or ""
 
+# Docker container pool configuration. The pool keeps pre-started containers
+# around so requests don't pay the container cold-start; set size to 0 to
+# disable pooling and start a fresh container per request.
+PYTHON_EXECUTOR_DOCKER_POOL_SIZE = int(os.environ.get("PYTHON_EXECUTOR_DOCKER_POOL_SIZE") or 2)
+PYTHON_EXECUTOR_DOCKER_POOL_MAX_JOBS = int(
+    os.environ.get("PYTHON_EXECUTOR_DOCKER_POOL_MAX_JOBS") or 32
+)
+
 # Kubernetes executor configuration
 KUBERNETES_EXECUTOR_NAMESPACE = os.environ.get("KUBERNETES_EXECUTOR_NAMESPACE") or "default"
 KUBERNETES_EXECUTOR_IMAGE = (
@@ -24,8 +32,32 @@ KUBERNETES_EXECUTOR_SERVICE_ACCOUNT = os.environ.get("KUBERNETES_EXECUTOR_SERVIC
 # Execution limits
 MAX_EXEC_TIMEOUT_MS = int(os.environ.get("MAX_EXEC_TIMEOUT_MS") or 60_000)
 MAX_OUTPUT_BYTES = int(os.environ.get("MAX_OUTPUT_BYTES") or 1_000_000)
+# Request payload limits, rejected up front before any container work
+MAX_CODE_BYTES = int(os.environ.get("MAX_CODE_BYTES") or 262_144)
+MAX_STDIN_BYTES = int(os.environ.get("MAX_STDIN_BYTES") or 1_000_000)
 CPU_TIME_LIMIT_SEC = int(os.environ.get("CPU_TIME_LIMIT_SEC") or 5)
 MEMORY_LIMIT_MB = int(os.environ.get("MEMORY_LIMIT_MB") or 256)
+# Grace period between SIGTERM and SIGKILL when stopping user code on timeout,
+# giving the interpreter a chance to flush output and run cleanup handlers.
+SIGTERM_GRACE_MS = int(os.environ.get("SIGTERM_GRACE_MS") or 100)
+# Cap on concurrently executing containers; excess requests fail fast with 503
+# instead of piling heavyweight container processes onto the host. Also sizes
+# the dedicated execution thread pool, and the shared anyio worker-thread pool
+# at startup (2x this value, replacing the fixed 40-token default) so
+# executions and other offloaded work don't starve each other.
+MAX_CONCURRENT_EXEC = int(os.environ.get("MAX_CONCURRENT_EXEC") or (os.cpu_count() or 4))
+
+# Result caching. When enabled, identical (code, stdin) submissions that
+# previously succeeded are served from an in-memory LRU without re-executing.
+# Off by default: nondeterministic code (random, time, network) must not be
+# cached, and the service cannot prove determinism - only enable this for
+# traffic known to be deterministic (e.g. doc examples, grading harnesses).
+ENABLE_RESULT_CACHE = (os.environ.get("ENABLE_RESULT_CACHE") or "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+RESULT_CACHE_MAX_ENTRIES = int(os.environ.get("RESULT_CACHE_MAX_ENTRIES") or 1024)
 
 # API server configuration
 HOST = os.environ.get("HOST") or "0.0.0.0"  # noqa: S104
@@ -43,8 +75,11 @@ FILE_TTL_SEC = int(os.environ.get("FILE_TTL_SEC") or 3600)
 class Settings:
     max_exec_timeout_ms: int
     max_output_bytes: int
+    max_code_bytes: int
+    max_stdin_bytes: int
     cpu_time_limit_sec: int
     memory_limit_mb: int
+    max_concurrent_exec: int
     file_storage_dir: str
     max_file_size_mb: int
     file_ttl_sec: int
@@ -54,8 +89,11 @@ class Settings:
         return Settings(
             max_exec_timeout_ms=MAX_EXEC_TIMEOUT_MS,
             max_output_bytes=MAX_OUTPUT_BYTES,
+            max_code_bytes=MAX_CODE_BYTES,
+            max_stdin_bytes=MAX_STDIN_BYTES,
             cpu_time_limit_sec=CPU_TIME_LIMIT_SEC,
             memory_limit_mb=MEMORY_LIMIT_MB,
+            max_concurrent_exec=MAX_CONCURRENT_EXEC,
             file_storage_dir=FILE_STORAGE_DIR,
             max_file_size_mb=MAX_FILE_SIZE_MB,
             file_ttl_sec=FILE_TTL_SEC,
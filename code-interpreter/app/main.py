@@ -7,10 +7,19 @@ from contextlib import asynccontextmanager
 from shutil import which
 from typing import Final
 
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router as api_router
-from app.app_configs import EXECUTOR_BACKEND, HOST, PORT, PYTHON_EXECUTOR_DOCKER_IMAGE
+from app.app_configs import (
+    EXECUTOR_BACKEND,
+    HOST,
+    PORT,
+    PYTHON_EXECUTOR_DOCKER_IMAGE,
+    get_settings,
+)
+from app.services.worker_pool import ContainerPool
 
 # Configure logging
 logging.basicConfig(
@@ -76,18 +85,53 @@ def _ensure_docker_image_available() -> None:
         ) from e
 
 
+def _get_docker_container_pool() -> ContainerPool | None:
+    """Return the Docker executor's container pool, if one is configured."""
+    from app.services.executor_docker import DockerExecutor
+    from app.services.executor_factory import get_executor
+
+    try:
+        executor = get_executor()
+    except RuntimeError as exc:
+        logger.warning(f"Executor unavailable, skipping container pool setup: {exc}")
+        return None
+
+    if isinstance(executor, DockerExecutor):
+        return executor.pool
+    return None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application lifespan events."""
-    # Startup: Ensure Docker executor image is available before accepting requests
+    # Startup: Size the shared worker-thread pool relative to the execution
+    # concurrency cap. Executions run on their own dedicated pool, but sync
+    # endpoints and other offloaded work still use anyio's shared threads, so
+    # keep its capacity proportional rather than pinned at the 40-token
+    # default.
+    settings = get_settings()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.max_concurrent_exec * 2
+
+    # Ensure Docker executor image is available before accepting requests
+    pool: ContainerPool | None = None
     if EXECUTOR_BACKEND == "docker":
         logger.info("Ensuring Docker executor image is available...")
         _ensure_docker_image_available()
         logger.info("Docker executor image is ready")
 
+        # Pre-start pooled containers so the first requests don't pay container
+        # startup cost.
+        pool = _get_docker_container_pool()
+        if pool is not None:
+            logger.info(f"Warming up container pool (size={pool.size})...")
+            pool.warm_up()
+            logger.info("Container pool is warm")
+
     yield
 
-    # Shutdown: Add any cleanup logic here if needed in the future
+    # Shutdown: Stop pooled containers so they don't outlive the service
+    if pool is not None:
+        pool.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -98,6 +142,9 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        # orjson serializes large string payloads (up to 2 MB of stdout/stderr
+        # per response) far faster than the stdlib json encoder
+        default_response_class=ORJSONResponse,
     )
 
     @app.get("/health")
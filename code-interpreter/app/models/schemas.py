@@ -2,28 +2,32 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, StrictInt, StrictStr
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExecuteFile(BaseModel):
-    path: StrictStr = Field(..., description="Relative file path within the execution workspace.")
-    file_id: StrictStr = Field(
+    model_config = ConfigDict(extra="forbid")
+
+    path: str = Field(..., description="Relative file path within the execution workspace.")
+    file_id: str = Field(
         ..., description="UUID of a previously uploaded file to use for execution."
     )
 
 
 class WorkspaceFile(BaseModel):
-    path: StrictStr
+    path: str
     kind: Literal["file", "directory"]
-    file_id: StrictStr | None = Field(
+    file_id: str | None = Field(
         None, description="ID of the file in storage (only for files, not directories)."
     )
 
 
 class ExecuteRequest(BaseModel):
-    code: StrictStr = Field(..., description="Python source to execute.")
-    stdin: StrictStr | None = Field(None, description="Optional stdin passed to the program.")
-    timeout_ms: StrictInt = Field(2000, ge=1, description="Execution timeout in milliseconds.")
+    model_config = ConfigDict(extra="forbid")
+
+    code: str = Field(..., description="Python source to execute.")
+    stdin: str | None = Field(None, description="Optional stdin passed to the program.")
+    timeout_ms: int = Field(2000, ge=1, description="Execution timeout in milliseconds.")
     last_line_interactive: bool = Field(
         True,
         description=(
@@ -36,14 +40,21 @@ class ExecuteRequest(BaseModel):
         default_factory=list,
         description="Optional collection of files to stage in the execution workspace.",
     )
+    no_cache: bool = Field(
+        False,
+        description=(
+            "If True, bypass the server-side result cache (when enabled) and always "
+            "re-execute the code."
+        ),
+    )
 
 
 class ExecuteResponse(BaseModel):
-    stdout: StrictStr
-    stderr: StrictStr
+    stdout: str
+    stderr: str
     exit_code: int | None
     timed_out: bool
-    duration_ms: StrictInt
+    duration_ms: int
     files: list[WorkspaceFile] = Field(
         default_factory=list,
         description="Snapshot of the execution workspace after completion.",
@@ -51,15 +62,15 @@ class ExecuteResponse(BaseModel):
 
 
 class UploadFileResponse(BaseModel):
-    file_id: StrictStr = Field(..., description="Unique identifier for the uploaded file.")
-    filename: StrictStr = Field(..., description="Original filename as provided during upload.")
-    size_bytes: StrictInt = Field(..., description="Size of the uploaded file in bytes.")
+    file_id: str = Field(..., description="Unique identifier for the uploaded file.")
+    filename: str = Field(..., description="Original filename as provided during upload.")
+    size_bytes: int = Field(..., description="Size of the uploaded file in bytes.")
 
 
 class FileMetadataResponse(BaseModel):
-    file_id: StrictStr
-    filename: StrictStr
-    size_bytes: StrictInt
+    file_id: str
+    filename: str
+    size_bytes: int
     upload_time: float = Field(..., description="Unix timestamp of when the file was uploaded.")
 
 
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import ast
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, Protocol
 
+# Sources above this size skip the wrapper memoization cache. The cache keeps
+# both the source and the wrapped copy (which embeds the escaped source, ~2x
+# its size) alive for the process lifetime, so caching large submissions up to
+# MAX_CODE_BYTES would let repeated distinct payloads pin hundreds of MB of
+# host memory. The memoization win is for small repeat snippets anyway.
+_WRAP_CACHE_MAX_SOURCE_CHARS = 16_384
+
 
 def wrap_last_line_interactive(code: str) -> str:
     """
@@ -14,12 +23,41 @@ def wrap_last_line_interactive(code: str) -> str:
     which automatically prints the value to stdout, mimicking Jupyter notebook behavior.
     Only the last line is affected; earlier expressions are not printed.
 
+    The code is parsed host-side first: if it doesn't end in a bare
+    expression there is nothing to print, so it is returned unwrapped and the
+    guest skips the wrapper's parse/exec machinery entirely (and tracebacks
+    keep their real line numbers). Code that fails to parse is also returned
+    as-is so the guest raises a clean SyntaxError.
+
+    Results for small sources are memoized by source string: repeat
+    submissions of the same snippet (IDE "run" buttons, retries) skip
+    rebuilding the wrapper. Large sources bypass the cache so it stays
+    bounded in bytes, not just entries.
+
     Args:
         code: The Python code to wrap
 
     Returns:
         Wrapped Python code that will print the last expression's value if it's a bare expression
     """
+    if len(code) <= _WRAP_CACHE_MAX_SOURCE_CHARS:
+        return _wrap_last_line_interactive_cached(code)
+    return _wrap_last_line_interactive(code)
+
+
+@lru_cache(maxsize=512)
+def _wrap_last_line_interactive_cached(code: str) -> str:
+    return _wrap_last_line_interactive(code)
+
+
+def _wrap_last_line_interactive(code: str) -> str:
+    try:
+        parsed = ast.parse(code)
+    except SyntaxError:
+        return code
+    if not parsed.body or not isinstance(parsed.body[-1], ast.Expr):
+        return code
+
     # Escape the code string for embedding in Python source
     code_escaped = code.replace("\\", "\\\\").replace("'", "\\'")
 
@@ -1,11 +1,14 @@
 import io
 import logging
+import os
+import queue
+import selectors
 import shlex
 import subprocess
 import tarfile
 import time
 import uuid
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from contextlib import suppress
 from pathlib import Path
 from shutil import which
@@ -13,7 +16,11 @@ from shutil import which
 from app.app_configs import (
     PYTHON_EXECUTOR_DOCKER_BIN,
     PYTHON_EXECUTOR_DOCKER_IMAGE,
+    PYTHON_EXECUTOR_DOCKER_POOL_MAX_JOBS,
+    PYTHON_EXECUTOR_DOCKER_POOL_SIZE,
     PYTHON_EXECUTOR_DOCKER_RUN_ARGS,
+    SIGTERM_GRACE_MS,
+    get_settings,
 )
 from app.services.executor_base import (
     BaseExecutor,
@@ -21,15 +28,197 @@ from app.services.executor_base import (
     WorkspaceEntry,
     wrap_last_line_interactive,
 )
+from app.services.worker_pool import ContainerPool
 
 logger = logging.getLogger(__name__)
 
+# Lifetime of pooled containers; they are recycled after a bounded number of
+# jobs long before this sleep expires.
+_POOL_CONTAINER_LIFETIME_SEC = 86_400
+
+# How long a request waits for an idle pooled container before falling back
+# to starting a one-shot container.
+_POOL_ACQUIRE_TIMEOUT_SEC = 1.0
+
+# Chunk size for incremental pipe reads/writes during execution.
+_PIPE_CHUNK_BYTES = 65_536
+
+# Pool of preallocated capture buffers reused across requests. Output capture
+# needs up to ~1 MB per stream per request; reusing buffers keeps allocator
+# pressure flat under sustained load instead of churning fresh megabyte
+# allocations on every call. The pool grows to the number of concurrently
+# executing requests and no further.
+_CAPTURE_BUF_POOL: queue.LifoQueue[bytearray] = queue.LifoQueue()
+
+
+def _acquire_capture_buffer(capacity: int) -> bytearray:
+    """Take a pooled buffer of at least `capacity` bytes, allocating if needed."""
+    try:
+        buf = _CAPTURE_BUF_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(capacity)
+    if len(buf) < capacity:
+        return bytearray(capacity)
+    return buf
+
+
+def _release_capture_buffer(buf: bytearray) -> None:
+    """Return a buffer to the pool for reuse."""
+    with suppress(queue.Full):
+        _CAPTURE_BUF_POOL.put_nowait(buf)
+
+
+def _communicate_bounded(
+    proc: subprocess.Popen[bytes],
+    input_bytes: bytes | None,
+    timeout_sec: float,
+    max_output_bytes: int,
+    kill_runaway: Callable[[], None],
+) -> tuple[bytes, bytes, bool]:
+    """Exchange data with a child process while capping captured output.
+
+    Unlike `Popen.communicate`, which buffers the child's entire stdout/stderr
+    before truncation (a runaway print loop can allocate gigabytes host-side),
+    this reads incrementally and stops retaining data once a stream exceeds
+    `max_output_bytes` (plus a little slack so truncation is detectable).
+    Once a stream produces more than twice the limit, `kill_runaway` is
+    invoked to stop the child early; the wall-clock timeout is enforced in
+    the same loop.
+
+    Captured data lands in pooled, preallocated buffers (see
+    `_CAPTURE_BUF_POOL`) rather than freshly grown bytearrays.
+
+    Returns (stdout, stderr, timed_out). On timeout the partial output
+    captured so far is returned and the caller is responsible for killing
+    the child.
+    """
+    if proc.stdin is None or proc.stdout is None or proc.stderr is None:
+        raise RuntimeError("Child process must be started with stdin/stdout/stderr pipes.")
+
+    # Slack past the limit so truncate_output still sees an over-limit stream
+    # and appends its truncation marker.
+    retain_cap = max_output_bytes + 64
+    hard_cap = max_output_bytes * 2
+
+    stdout_buf = _acquire_capture_buffer(retain_cap)
+    stderr_buf = _acquire_capture_buffer(retain_cap)
+    produced = {proc.stdout.fileno(): 0, proc.stderr.fileno(): 0}
+    buffers = {proc.stdout.fileno(): stdout_buf, proc.stderr.fileno(): stderr_buf}
+    # Bytes retained so far per stream (buffers are preallocated, so their
+    # length is capacity, not content size).
+    retained = {proc.stdout.fileno(): 0, proc.stderr.fileno(): 0}
+
+    timed_out = False
+    runaway_killed = False
+
+    sel = selectors.DefaultSelector()
+    sel.register(proc.stdout, selectors.EVENT_READ)
+    sel.register(proc.stderr, selectors.EVENT_READ)
+
+    input_view = memoryview(input_bytes) if input_bytes else None
+    input_offset = 0
+    if input_view is not None:
+        # A pipe polls writable with as little as one page free, but a
+        # blocking write of a larger chunk stalls until the child drains
+        # *all* of it - a child that reads a little stdin and then sleeps
+        # would wedge this thread past any deadline. Non-blocking writes
+        # return a partial count instead and the loop retries on the next
+        # writable event, re-checking the deadline each pass.
+        os.set_blocking(proc.stdin.fileno(), False)
+        sel.register(proc.stdin, selectors.EVENT_WRITE)
+    else:
+        proc.stdin.close()
+
+    deadline = time.monotonic() + timeout_sec
+    open_reads = 2
+    try:
+        while open_reads > 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+
+            for key, _ in sel.select(remaining):
+                if key.fileobj is proc.stdin:
+                    if input_view is None:
+                        continue
+                    try:
+                        written = os.write(
+                            proc.stdin.fileno(),
+                            input_view[input_offset : input_offset + _PIPE_CHUNK_BYTES],
+                        )
+                        input_offset += written
+                    except BlockingIOError:
+                        # Pipe filled up between the poll and the write; retry
+                        # on the next writable event.
+                        continue
+                    except OSError:
+                        # Child closed stdin early (e.g. never reads input)
+                        input_offset = len(input_view)
+                    if input_offset >= len(input_view):
+                        sel.unregister(proc.stdin)
+                        with suppress(OSError):
+                            proc.stdin.close()
+                    continue
+
+                fd = key.fd
+                chunk = os.read(fd, _PIPE_CHUNK_BYTES)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    open_reads -= 1
+                    continue
+
+                produced[fd] += len(chunk)
+                kept = retained[fd]
+                if kept < retain_cap:
+                    take = min(len(chunk), retain_cap - kept)
+                    buffers[fd][kept : kept + take] = chunk[:take]
+                    retained[fd] = kept + take
+
+                if produced[fd] > hard_cap and not runaway_killed:
+                    runaway_killed = True
+                    kill_runaway()
+    finally:
+        sel.close()
+
+    if not timed_out:
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0.1))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+
+    stdout_len = retained[proc.stdout.fileno()]
+    stderr_len = retained[proc.stderr.fileno()]
+    stdout_bytes = bytes(memoryview(stdout_buf)[:stdout_len])
+    stderr_bytes = bytes(memoryview(stderr_buf)[:stderr_len])
+    _release_capture_buffer(stdout_buf)
+    _release_capture_buffer(stderr_buf)
+    return stdout_bytes, stderr_bytes, timed_out
+
 
 class DockerExecutor(BaseExecutor):
     def __init__(self) -> None:
         self.docker_binary = self._resolve_docker_binary()
         self.image = PYTHON_EXECUTOR_DOCKER_IMAGE
-        self.run_args = PYTHON_EXECUTOR_DOCKER_RUN_ARGS
+        # Operator-supplied run args never change at runtime; parse them once
+        # instead of re-running shlex.split on every container start.
+        self.run_args: tuple[str, ...] = tuple(shlex.split(PYTHON_EXECUTOR_DOCKER_RUN_ARGS))
+        self._run_command_prefix = self._build_run_command_prefix()
+
+        # Pooled containers are started with the process-wide execution limits;
+        # requests with matching limits reuse them, others get a one-shot
+        # container with the requested limits.
+        settings = get_settings()
+        self.pool_cpu_time_limit_sec = settings.cpu_time_limit_sec
+        self.pool_memory_limit_mb = settings.memory_limit_mb
+        self.pool: ContainerPool | None = None
+        if PYTHON_EXECUTOR_DOCKER_POOL_SIZE > 0:
+            self.pool = ContainerPool(
+                start_container=self._start_pooled_container,
+                kill_container=self._kill_container,
+                size=PYTHON_EXECUTOR_DOCKER_POOL_SIZE,
+                max_jobs_per_container=PYTHON_EXECUTOR_DOCKER_POOL_MAX_JOBS,
+            )
 
     def _resolve_docker_binary(self) -> str:
         candidate = PYTHON_EXECUTOR_DOCKER_BIN
@@ -41,6 +230,37 @@ class DockerExecutor(BaseExecutor):
             )
         return docker_path
 
+    def _kill_python(self, container_name: str) -> None:
+        """Stop the Python process inside a container (as root to ensure we can kill it).
+
+        Sends SIGTERM first so the interpreter can flush output and run
+        cleanup handlers, then SIGKILLs anything still alive after the
+        configured grace period.
+        """
+        subprocess.run(
+            [self.docker_binary, "exec", container_name, "pkill", "-TERM", "python"],
+            capture_output=True,
+        )
+        time.sleep(SIGTERM_GRACE_MS / 1000.0)
+        subprocess.run(
+            [self.docker_binary, "exec", container_name, "pkill", "-9", "python"],
+            capture_output=True,
+        )
+
+    def _kill_user_processes(self, container_name: str) -> None:
+        """Kill anything still running as the unprivileged execution user.
+
+        Run before every pooled-container reuse: user code can leave
+        background processes behind even on a clean exit (e.g. by
+        double-forking), and anything surviving as uid 65532 could read or
+        tamper with the next request's workspace. The container's root-owned
+        sleep process is unaffected.
+        """
+        subprocess.run(
+            [self.docker_binary, "exec", container_name, "pkill", "-9", "-u", "65532"],
+            capture_output=True,
+        )
+
     def _kill_container(self, name: str) -> None:
         with suppress(Exception):
             subprocess.run(
@@ -109,9 +329,6 @@ class DockerExecutor(BaseExecutor):
 
     def _extract_workspace_snapshot(self, container_name: str) -> tuple[WorkspaceEntry, ...]:
         """Extract files from the container workspace after execution using tar."""
-        import io
-        import tarfile
-
         try:
             # Use tar to get all files from workspace (excluding __main__.py)
             tar_cmd = [
@@ -159,29 +376,15 @@ class DockerExecutor(BaseExecutor):
         except (subprocess.TimeoutExpired, Exception):
             return tuple()
 
-    def execute_python(
-        self,
-        *,
-        code: str,
-        stdin: str | None,
-        timeout_ms: int,
-        max_output_bytes: int,
-        cpu_time_limit_sec: int | None = None,
-        memory_limit_mb: int | None = None,
-        files: Sequence[tuple[str, bytes]] | None = None,
-        last_line_interactive: bool = True,
-    ) -> ExecutionResult:
-        """Execute Python code inside an ephemeral Docker container with no network.
+    def _build_run_command_prefix(self) -> tuple[str, ...]:
+        """Build the invariant `docker run` flags shared by every execution container.
 
-        Args:
-            last_line_interactive: If True, the last line will print its value to stdout
-                                   if it's a bare expression (only the last line is affected).
+        Computed once at init; per-request commands only append the container
+        name, resource limits, operator run args, and the image/sleep tail.
         """
-        container_name = f"code-exec-{uuid.uuid4().hex}"
-
-        # Start the container in detached mode
+        # Containers start in detached mode
         # We need CAP_CHOWN to set up the workspace, but we'll drop privileges for execution
-        cmd: list[str] = [
+        return (
             self.docker_binary,
             "run",
             "-d",  # detached mode
@@ -190,8 +393,6 @@ class DockerExecutor(BaseExecutor):
             "never",
             "--network",
             "none",
-            "--name",
-            container_name,
             "--cgroupns",
             "host",  # Use host cgroup namespace to avoid cgroup v2 issues in DinD
             "--pids-limit",
@@ -217,7 +418,17 @@ class DockerExecutor(BaseExecutor):
             "PYTHONIOENCODING=utf-8",
             "--env",
             "MPLCONFIGDIR=/tmp/matplotlib",
-        ]
+        )
+
+    def _build_run_command(
+        self,
+        container_name: str,
+        cpu_time_limit_sec: int | None,
+        memory_limit_mb: int | None,
+        sleep_sec: int,
+    ) -> list[str]:
+        """Build the `docker run` command for an execution container."""
+        cmd: list[str] = [*self._run_command_prefix, "--name", container_name]
 
         if cpu_time_limit_sec is not None:
             cpu_limit = max(int(cpu_time_limit_sec), 1)
@@ -229,91 +440,230 @@ class DockerExecutor(BaseExecutor):
             cmd.extend(["--memory", mem_flag, "--memory-swap", mem_flag])
 
         if self.run_args:
-            cmd.extend(shlex.split(self.run_args))
+            cmd.extend(self.run_args)
 
         # Just sleep - workspace is already created as tmpfs with correct ownership
         cmd.extend(
             [
                 self.image,
                 "sleep",
-                str((timeout_ms * 1000) + 10),
+                str(sleep_sec),
             ]
         )
 
-        # Start the container
+        return cmd
+
+    def _start_container(
+        self,
+        container_name: str,
+        cpu_time_limit_sec: int | None,
+        memory_limit_mb: int | None,
+        sleep_sec: int,
+    ) -> None:
+        """Start a detached execution container, raising if startup fails."""
+        cmd = self._build_run_command(
+            container_name, cpu_time_limit_sec, memory_limit_mb, sleep_sec
+        )
         start_proc = subprocess.run(cmd, capture_output=True, text=True)  # nosec B603
         if start_proc.returncode != 0:
             raise RuntimeError(f"Failed to start container: {start_proc.stderr}")
 
+    def _start_pooled_container(self, container_name: str) -> None:
+        """Start a long-lived pooled container with the process-wide limits."""
+        self._start_container(
+            container_name,
+            self.pool_cpu_time_limit_sec,
+            self.pool_memory_limit_mb,
+            _POOL_CONTAINER_LIFETIME_SEC,
+        )
+
+    def _reset_workspace(self, container_name: str) -> bool:
+        """Remove everything from a pooled container's workspace between jobs.
+
+        Returns False if the reset fails or times out (e.g. the container
+        died or hung), in which case the container must not be reused.
+        """
         try:
-            logger.debug(f"Executing code: {code}")
+            reset_proc = subprocess.run(
+                [
+                    self.docker_binary,
+                    "exec",
+                    "-u",
+                    "65532:65532",
+                    container_name,
+                    "find",
+                    "/workspace",
+                    "-mindepth",
+                    "1",
+                    "-delete",
+                ],
+                capture_output=True,
+                timeout=10,
+                check=False,
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        return reset_proc.returncode == 0
 
-            # Create tar archive with the code and files
-            tar_archive = self._create_tar_archive(code, files, last_line_interactive)
+    def execute_python(
+        self,
+        *,
+        code: str,
+        stdin: str | None,
+        timeout_ms: int,
+        max_output_bytes: int,
+        cpu_time_limit_sec: int | None = None,
+        memory_limit_mb: int | None = None,
+        files: Sequence[tuple[str, bytes]] | None = None,
+        last_line_interactive: bool = True,
+    ) -> ExecutionResult:
+        """Execute Python code inside an isolated Docker container with no network.
 
-            # Stream tar archive into the container (as the unprivileged user who owns /workspace)
-            tar_cmd = [
-                self.docker_binary,
-                "exec",
-                "-u",
-                "65532:65532",
-                "-i",
-                container_name,
-                "tar",
-                "-x",
-                "-C",
-                "/workspace",
-            ]
-            tar_proc = subprocess.run(tar_cmd, input=tar_archive, capture_output=True)  # nosec B603
-            if tar_proc.returncode != 0:
-                raise RuntimeError(
-                    f"Failed to extract files: {tar_proc.stderr.decode('utf-8', errors='replace')}"
-                )
-
-            # Execute the Python script as unprivileged user
-            start = time.perf_counter()
-            exec_cmd = [
-                self.docker_binary,
-                "exec",
-                "-u",
-                "65532:65532",
-                "-i",
+        Prefers a pre-started container from the pool when the requested limits
+        match the pool's configuration; otherwise (or when the pool is
+        exhausted) falls back to an ephemeral per-request container.
+
+        Args:
+            last_line_interactive: If True, the last line will print its value to stdout
+                                   if it's a bare expression (only the last line is affected).
+        """
+        logger.debug(f"Executing code: {code}")
+
+        # Build (and validate) the execution archive before touching the pool:
+        # invalid file paths raise ValueError here, before any container is
+        # acquired or started, and a pooled-to-one-shot fallback reuses the
+        # archive instead of rebuilding it.
+        tar_archive = self._create_tar_archive(code, files, last_line_interactive)
+
+        if (
+            self.pool is not None
+            and cpu_time_limit_sec == self.pool_cpu_time_limit_sec
+            and memory_limit_mb == self.pool_memory_limit_mb
+        ):
+            pooled = self.pool.acquire(timeout=_POOL_ACQUIRE_TIMEOUT_SEC)
+            if pooled is not None:
+                settled = False
+                try:
+                    try:
+                        result = self._execute_in_container(
+                            pooled.name,
+                            tar_archive=tar_archive,
+                            stdin=stdin,
+                            timeout_ms=timeout_ms,
+                            max_output_bytes=max_output_bytes,
+                        )
+                    except RuntimeError as exc:
+                        # The pooled container may have died; retire it and
+                        # retry below in a fresh one-shot container.
+                        logger.warning(f"Pooled container {pooled.name} failed: {exc}")
+                        self.pool.discard(pooled)
+                        settled = True
+                    else:
+                        # Sweep stray user processes on every release, not
+                        # just after timeouts: even a clean exit can leave
+                        # backgrounded children alive, and a survivor must not
+                        # share the container with the next request. The sweep
+                        # runs before the workspace reset so nothing can
+                        # repopulate the workspace afterwards; the reset
+                        # doubles as a liveness probe before the container is
+                        # reused.
+                        self._kill_user_processes(pooled.name)
+                        reusable = self._reset_workspace(pooled.name)
+                        self.pool.release(pooled, reusable=reusable)
+                        settled = True
+                        return result
+                finally:
+                    # An acquired container must never leak: if anything above
+                    # escaped without releasing or discarding, retire it so
+                    # the pool slot is reclaimed.
+                    if not settled:
+                        self.pool.discard(pooled)
+
+        container_name = f"code-exec-{uuid.uuid4().hex}"
+        self._start_container(
+            container_name,
+            cpu_time_limit_sec,
+            memory_limit_mb,
+            (timeout_ms * 1000) + 10,
+        )
+        try:
+            return self._execute_in_container(
                 container_name,
-                "python",
-                "/workspace/__main__.py",
-            ]
+                tar_archive=tar_archive,
+                stdin=stdin,
+                timeout_ms=timeout_ms,
+                max_output_bytes=max_output_bytes,
+            )
+        finally:
+            self._kill_container(container_name)
 
-            proc = subprocess.Popen(  # nosec B603: controlled argv
-                exec_cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=False,
+    def _execute_in_container(
+        self,
+        container_name: str,
+        *,
+        tar_archive: bytes,
+        stdin: str | None,
+        timeout_ms: int,
+        max_output_bytes: int,
+    ) -> ExecutionResult:
+        """Stage a prebuilt archive into a container, execute it, and snapshot the workspace."""
+        # Stream tar archive into the container (as the unprivileged user who owns /workspace)
+        tar_cmd = [
+            self.docker_binary,
+            "exec",
+            "-u",
+            "65532:65532",
+            "-i",
+            container_name,
+            "tar",
+            "-x",
+            "-C",
+            "/workspace",
+        ]
+        tar_proc = subprocess.run(tar_cmd, input=tar_archive, capture_output=True)  # nosec B603
+        if tar_proc.returncode != 0:
+            raise RuntimeError(
+                f"Failed to extract files: {tar_proc.stderr.decode('utf-8', errors='replace')}"
             )
 
-            try:
-                input_bytes = stdin.encode("utf-8") if stdin is not None else None
-                stdout_bytes, stderr_bytes = proc.communicate(
-                    input=input_bytes,
-                    timeout=timeout_ms / 1000.0,
-                )
-                timed_out = False
-            except subprocess.TimeoutExpired:
-                timed_out = True
-                # Kill the Python process in the container (as root to ensure we can kill it)
-                subprocess.run(
-                    [self.docker_binary, "exec", container_name, "pkill", "-9", "python"],
-                    capture_output=True,
-                )
-                proc.kill()
-                stdout_bytes, stderr_bytes = proc.communicate()
+        # Execute the Python script as unprivileged user
+        start = time.perf_counter()
+        exec_cmd = [
+            self.docker_binary,
+            "exec",
+            "-u",
+            "65532:65532",
+            "-i",
+            container_name,
+            "python",
+            "/workspace/__main__.py",
+        ]
 
-            # Extract workspace snapshot
-            workspace_snapshot = self._extract_workspace_snapshot(container_name)
+        proc = subprocess.Popen(  # nosec B603: controlled argv
+            exec_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=False,
+        )
 
-        finally:
-            # Clean up container
-            self._kill_container(container_name)
+        input_bytes = stdin.encode("utf-8") if stdin is not None else None
+        stdout_bytes, stderr_bytes, timed_out = _communicate_bounded(
+            proc,
+            input_bytes,
+            timeout_ms / 1000.0,
+            max_output_bytes,
+            kill_runaway=lambda: self._kill_python(container_name),
+        )
+        if timed_out:
+            # Stop the Python process in the container (SIGTERM, then SIGKILL)
+            self._kill_python(container_name)
+            proc.kill()
+            with suppress(Exception):
+                proc.wait(timeout=5)
+
+        # Extract workspace snapshot
+        workspace_snapshot = self._extract_workspace_snapshot(container_name)
 
         duration_ms = int((time.perf_counter() - start) * 1000)
 
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
 from functools import lru_cache
+from hashlib import blake2b
 
-from app.app_configs import EXECUTOR_BACKEND
+from app.app_configs import ENABLE_RESULT_CACHE, EXECUTOR_BACKEND, RESULT_CACHE_MAX_ENTRIES
 from app.services.executor_base import BaseExecutor, ExecutionResult
 
+# LRU of prior successful results keyed by a digest of the submission (see
+# _result_cache_key). Guarded by a lock since executions run across worker
+# threads.
+_result_cache: OrderedDict[bytes, ExecutionResult] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
 
 @lru_cache(maxsize=1)
 def get_executor() -> BaseExecutor:
@@ -24,6 +33,32 @@ def get_executor() -> BaseExecutor:
         raise ValueError(f"Unknown executor backend: {backend}")
 
 
+def _result_cache_key(code: str, stdin: str | None, last_line_interactive: bool) -> bytes:
+    """Build the cache key digest for a submission."""
+    hasher = blake2b(digest_size=16)
+    hasher.update(code.encode("utf-8"))
+    hasher.update(b"\x00")
+    hasher.update((stdin or "").encode("utf-8"))
+    hasher.update(b"\x01" if last_line_interactive else b"\x02")
+    return hasher.digest()
+
+
+def _result_cache_get(key: bytes) -> ExecutionResult | None:
+    with _result_cache_lock:
+        result = _result_cache.get(key)
+        if result is not None:
+            _result_cache.move_to_end(key)
+        return result
+
+
+def _result_cache_put(key: bytes, result: ExecutionResult) -> None:
+    with _result_cache_lock:
+        _result_cache[key] = result
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_MAX_ENTRIES:
+            _result_cache.popitem(last=False)
+
+
 def execute_python(
     *,
     code: str,
@@ -34,15 +69,35 @@ def execute_python(
     memory_limit_mb: int | None = None,
     files: Sequence[tuple[str, bytes]] | None = None,
     last_line_interactive: bool = True,
+    no_cache: bool = False,
 ) -> ExecutionResult:
     """Execute Python code using the configured backend.
 
+    When ENABLE_RESULT_CACHE is set, repeat submissions of an identical
+    (code, stdin) pair are served from an LRU of prior results instead of
+    re-executing. Only clean runs are cached (exit code 0, no timeout, no
+    staged or produced files), a hit is served only when the cached run's
+    duration fits within the caller's `timeout_ms`, and callers can opt out
+    per request via `no_cache`.
+
     Args:
         last_line_interactive: If True, the last line will print its value to stdout
                                if it's a bare expression (only the last line is affected).
+        no_cache: If True, bypass the result cache for this request.
     """
+    cacheable = ENABLE_RESULT_CACHE and not no_cache and not files
+    key = b""
+    if cacheable:
+        key = _result_cache_key(code, stdin, last_line_interactive)
+        cached = _result_cache_get(key)
+        # Only replay a result the caller's own timeout would have allowed;
+        # a run cached under a generous timeout must not masquerade as a
+        # success for a stricter one.
+        if cached is not None and cached.duration_ms <= timeout_ms:
+            return cached
+
     executor = get_executor()
-    return executor.execute_python(
+    result = executor.execute_python(
         code=code,
         stdin=stdin,
         timeout_ms=timeout_ms,
@@ -52,3 +107,8 @@ def execute_python(
         files=files,
         last_line_interactive=last_line_interactive,
     )
+
+    if cacheable and result.exit_code == 0 and not result.timed_out and not result.files:
+        _result_cache_put(key, result)
+
+    return result
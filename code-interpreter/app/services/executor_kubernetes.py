@@ -25,6 +25,7 @@ from app.app_configs import (
     KUBERNETES_EXECUTOR_IMAGE,
     KUBERNETES_EXECUTOR_NAMESPACE,
     KUBERNETES_EXECUTOR_SERVICE_ACCOUNT,
+    SIGTERM_GRACE_MS,
 )
 from app.services.executor_base import (
     BaseExecutor,
@@ -461,18 +462,27 @@ class KubernetesExecutor(BaseExecutor):
             exec_resp.close()
 
             if timed_out:
-                exec_command = ["pkill", "-9", "python"]
-                with suppress(Exception):
-                    stream.stream(
-                        self.v1.connect_get_namespaced_pod_exec,
-                        pod_name,
-                        self.namespace,
-                        command=exec_command,
-                        stderr=False,
-                        stdin=False,
-                        stdout=False,
-                        tty=False,
-                    )
+                # SIGTERM first so the interpreter can flush output and run
+                # cleanup handlers, then SIGKILL anything still alive after
+                # the grace period.
+                for signal_flag, grace_sec in (
+                    ("-TERM", SIGTERM_GRACE_MS / 1000.0),
+                    ("-9", 0.0),
+                ):
+                    exec_command = ["pkill", signal_flag, "python"]
+                    with suppress(Exception):
+                        stream.stream(
+                            self.v1.connect_get_namespaced_pod_exec,
+                            pod_name,
+                            self.namespace,
+                            command=exec_command,
+                            stderr=False,
+                            stdin=False,
+                            stdout=False,
+                            tty=False,
+                        )
+                    if grace_sec:
+                        time.sleep(grace_sec)
 
             logger.info(
                 f"Python execution completed. Exit code: {exit_code}, Timed out: {timed_out}"
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 import time
 import uuid
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
@@ -30,6 +32,17 @@ class FileStorageService:
         """Get the filesystem path for file metadata."""
         return self.storage_dir / f"{file_id}.meta.json"
 
+    def _iter_metadata_paths(self) -> Iterator[Path]:
+        """Yield all metadata file paths in a single scandir pass.
+
+        Cheaper than globbing: no pattern matching, and the dirent type check
+        avoids a stat call per entry.
+        """
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".meta.json") and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+
     def save_file(self, content: bytes, filename: str) -> str:
         """Save file content and return a unique file ID.
 
@@ -73,16 +86,18 @@ class FileStorageService:
         file_path = self._get_file_path(file_id)
         metadata_path = self._get_metadata_path(file_id)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File with ID '{file_id}' not found")
-
-        content = file_path.read_bytes()
+        # Open directly rather than stat-then-open: one syscall per file and
+        # no window for the file to disappear between check and read
+        try:
+            content = file_path.read_bytes()
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"File with ID '{file_id}' not found") from exc
 
         # Read metadata if available, otherwise create minimal metadata
-        if metadata_path.exists():
+        try:
             meta_dict = json.loads(metadata_path.read_text(encoding="utf-8"))
             metadata = FileMetadata(**meta_dict)
-        else:
+        except FileNotFoundError:
             # Fallback for files without metadata
             metadata = FileMetadata(
                 file_id=file_id,
@@ -105,13 +120,14 @@ class FileStorageService:
         file_path = self._get_file_path(file_id)
         metadata_path = self._get_metadata_path(file_id)
 
-        existed = file_path.exists()
-
-        # Remove both file and metadata if they exist
-        if file_path.exists():
+        # Remove both file and metadata if they exist; the unlink itself
+        # reports whether the file was there, so no stat calls are needed
+        try:
             file_path.unlink()
-        if metadata_path.exists():
-            metadata_path.unlink()
+            existed = True
+        except FileNotFoundError:
+            existed = False
+        metadata_path.unlink(missing_ok=True)
 
         return existed
 
@@ -123,7 +139,7 @@ class FileStorageService:
         """
         result: list[FileMetadata] = []
 
-        for metadata_path in self.storage_dir.glob("*.meta.json"):
+        for metadata_path in self._iter_metadata_paths():
             try:
                 meta_dict = json.loads(metadata_path.read_text(encoding="utf-8"))
                 result.append(FileMetadata(**meta_dict))
@@ -145,7 +161,7 @@ class FileStorageService:
         current_time = time.time()
         deleted_count = 0
 
-        for metadata_path in self.storage_dir.glob("*.meta.json"):
+        for metadata_path in self._iter_metadata_paths():
             try:
                 meta_dict = json.loads(metadata_path.read_text(encoding="utf-8"))
                 metadata = FileMetadata(**meta_dict)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledContainer:
+    """A pre-started container that can serve multiple executions."""
+
+    name: str
+    jobs_completed: int = field(default=0)
+
+
+class ContainerPool:
+    """Pool of pre-started containers used to amortize container startup cost.
+
+    Starting a fresh container for every `/v1/execute` call pays the full
+    container cold-start (image setup, tmpfs mounts, namespace creation) on
+    each request, which dominates latency for short snippets. The pool keeps
+    up to `size` containers running and hands them out per request; a
+    container is recycled after `max_jobs_per_container` executions or as soon
+    as a job leaves it in a non-reusable state.
+
+    The pool itself is backend-agnostic: starting and killing containers is
+    delegated to callables supplied by the executor that owns the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        start_container: Callable[[str], None],
+        kill_container: Callable[[str], None],
+        size: int,
+        max_jobs_per_container: int,
+    ) -> None:
+        self._start_container = start_container
+        self._kill_container = kill_container
+        self.size = size
+        self.max_jobs_per_container = max_jobs_per_container
+        self._idle: queue.LifoQueue[PooledContainer] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._live_count = 0
+        self._closed = False
+
+    def _spawn(self) -> PooledContainer | None:
+        """Start a new pooled container, returning None if startup fails."""
+        container = PooledContainer(name=f"code-exec-pool-{uuid.uuid4().hex}")
+        try:
+            self._start_container(container.name)
+        except Exception as exc:
+            logger.error(f"Failed to start pooled container {container.name}: {exc}")
+            with self._lock:
+                self._live_count -= 1
+            return None
+        logger.debug(f"Started pooled container {container.name}")
+        return container
+
+    def warm_up(self) -> None:
+        """Pre-start containers until the pool is at its configured size."""
+        while True:
+            with self._lock:
+                if self._closed or self._live_count >= self.size:
+                    return
+                self._live_count += 1
+            container = self._spawn()
+            if container is None:
+                return
+            self._idle.put_nowait(container)
+
+    def acquire(self, timeout: float) -> PooledContainer | None:
+        """Take an idle container, starting one if the pool is below size.
+
+        Returns None if no container becomes available within `timeout`
+        seconds; callers are expected to fall back to a one-shot container.
+        """
+        if self._closed:
+            return None
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            below_size = self._live_count < self.size
+            if below_size:
+                self._live_count += 1
+
+        if below_size:
+            return self._spawn()
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def release(self, container: PooledContainer, *, reusable: bool) -> None:
+        """Return a container to the pool, or retire it if it cannot be reused."""
+        container.jobs_completed += 1
+        if self._closed or not reusable or container.jobs_completed >= self.max_jobs_per_container:
+            self.discard(container)
+            return
+        self._idle.put_nowait(container)
+
+    def discard(self, container: PooledContainer) -> None:
+        """Kill a container and drop it from the pool's live count."""
+        logger.debug(
+            f"Discarding pooled container {container.name} after {container.jobs_completed} job(s)"
+        )
+        self._kill_container(container.name)
+        with self._lock:
+            self._live_count -= 1
+
+    def shutdown(self) -> None:
+        """Kill all idle containers and stop handing out new ones."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                container = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self.discard(container)
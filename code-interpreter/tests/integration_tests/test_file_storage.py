@@ -241,3 +241,33 @@ def test_upload_file_size_limit() -> None:
     # Should fail with 413 Request Entity Too Large
     assert response.status_code == 413
     assert "exceeds maximum" in response.json()["detail"].lower()
+
+
+def test_execute_rejects_duplicate_file_paths() -> None:
+    """Test that staging two files at the same workspace path is rejected."""
+    client = _client()
+
+    content = b"duplicate target"
+    files = {"file": ("dup.txt", io.BytesIO(content), "text/plain")}
+    upload_response = client.post("/v1/files", files=files)
+    assert upload_response.status_code == 201
+    file_id = upload_response.json()["file_id"]
+
+    exec_response = client.post(
+        "/v1/execute",
+        json={
+            "code": "print('should not run')",
+            "stdin": None,
+            "timeout_ms": 1000,
+            "files": [
+                {"path": "data.txt", "file_id": file_id},
+                {"path": "data.txt", "file_id": file_id},
+            ],
+        },
+    )
+
+    assert exec_response.status_code == 422
+    assert "duplicate" in exec_response.json()["detail"].lower()
+
+    # Clean up
+    client.delete(f"/v1/files/{file_id}")
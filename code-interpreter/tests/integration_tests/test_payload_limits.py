@@ -0,0 +1,41 @@
+"""Test that oversize payloads are rejected before execution."""
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+
+
+def test_execute_rejects_oversize_code() -> None:
+    """Test that code larger than MAX_CODE_BYTES returns 413."""
+    client = TestClient(create_app())
+
+    big_code = "#" + "x" * 300_000  # exceeds the 256 KB default limit
+
+    response = client.post(
+        "/v1/execute",
+        json={
+            "code": big_code,
+            "stdin": None,
+            "timeout_ms": 1000,
+        },
+    )
+
+    assert response.status_code == 413
+    assert "code exceeds maximum" in response.json()["detail"]
+
+
+def test_execute_rejects_oversize_stdin() -> None:
+    """Test that stdin larger than MAX_STDIN_BYTES returns 413."""
+    client = TestClient(create_app())
+
+    response = client.post(
+        "/v1/execute",
+        json={
+            "code": "print(input())",
+            "stdin": "x" * 1_100_000,  # exceeds the 1 MB default limit
+            "timeout_ms": 1000,
+        },
+    )
+
+    assert response.status_code == 413
+    assert "stdin exceeds maximum" in response.json()["detail"]